@@ -1,19 +1,29 @@
 import logging
-from pythonjsonlogger import json as jsonlogger
+from pythonjsonlogger.orjson import OrjsonFormatter
 from app.core.settings import settings
 
 logging.getLogger("uvicorn.error").name = "app.uvicorn"
 
 
-class CleanJSONFormatter(jsonlogger.JsonFormatter):
-    def process_log_record(self, log_record):
-        log_record.pop("color_message", None)
-        return super().process_log_record(log_record)
+class DropColorMessageFilter(logging.Filter):
+    """Strip uvicorn's ANSI-colored duplicate of the message before formatting."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.__dict__.pop("color_message", None)
+        return True
+
+
+def _build_handler(formatter: logging.Formatter) -> logging.Handler:
+    handler = logging.StreamHandler()
+    handler.setFormatter(formatter)
+    handler.addFilter(DropColorMessageFilter())
+    return handler
 
 
 def setup_logger() -> logging.Logger:
     """Setup logger with configuration from settings."""
-    formatter = CleanJSONFormatter(
+    # orjson serializes in C, which keeps JSON encoding off the hot path
+    formatter = OrjsonFormatter(
         fmt="%(asctime)s %(levelname)s %(name)s %(message)s",
         rename_fields={
             "levelname": "level",
@@ -27,9 +37,7 @@ def setup_logger() -> logging.Logger:
     logger.setLevel(getattr(logging, settings.log_level.upper(), logging.INFO))
 
     if not logger.hasHandlers():
-        handler = logging.StreamHandler()
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
+        logger.addHandler(_build_handler(formatter))
 
     # Configure uvicorn loggers
     for name in ["uvicorn", "uvicorn.error", "uvicorn.access"]:
@@ -37,9 +45,7 @@ def setup_logger() -> logging.Logger:
         uv_logger.handlers.clear()
         uv_logger.setLevel(getattr(logging, settings.log_level.upper(), logging.INFO))
         uv_logger.propagate = False
-        uv_handler = logging.StreamHandler()
-        uv_handler.setFormatter(formatter)
-        uv_logger.addHandler(uv_handler)
+        uv_logger.addHandler(_build_handler(formatter))
 
     # Deactivate access logger in production
     access_logger = logging.getLogger("uvicorn.access")
@@ -1,7 +1,5 @@
-from .logging import LoggingMiddleware
-from .request_id import RequestIDMiddleware
+from .observability import ObservabilityMiddleware
 
 __all__ = [
-    "LoggingMiddleware",
-    "RequestIDMiddleware",
+    "ObservabilityMiddleware",
 ]
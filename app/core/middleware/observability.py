@@ -0,0 +1,71 @@
+import uuid
+from typing import Optional
+from time import perf_counter
+from starlette.datastructures import URL, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.core.logger import logger
+from app.core.context import set_request_id
+from app.core.settings import settings
+
+
+class ObservabilityMiddleware:
+    """Assign a request ID, time the request and log it in one ASGI layer."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        # Docs routes live under the API prefix, so derive them rather than list them
+        prefix = settings.api_v1_prefix
+        self.excluded_paths = frozenset(
+            [
+                *settings.log_excluded_paths,
+                f"{prefix}/docs",
+                f"{prefix}/redoc",
+                f"{prefix}/openapi.json",
+            ]
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = _get_header(scope, b"x-request-id") or str(uuid.uuid4())
+        set_request_id(request_id)
+        status_code = 500
+
+        async def send_wrapper(message: Message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                # optional, for tracing back
+                MutableHeaders(scope=message)["X-Request-ID"] = request_id
+            await send(message)
+
+        if scope["path"] in self.excluded_paths:
+            await self.app(scope, receive, send_wrapper)
+            return
+
+        start_time = perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            duration = perf_counter() - start_time
+            client = scope.get("client")
+            logger.info(
+                "Finished processing request",
+                extra={
+                    "method": scope["method"],
+                    "url": str(URL(scope=scope)),
+                    "status_code": status_code,
+                    "duration_ms": round(duration * 1000, 2),
+                    "client_ip": client[0] if client else None,
+                    "request_id": request_id,
+                },
+            )
+
+
+def _get_header(scope: Scope, name: bytes) -> Optional[str]:
+    for key, value in scope["headers"]:
+        if key == name:
+            return value.decode("latin-1")
+    return None
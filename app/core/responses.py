@@ -0,0 +1,36 @@
+import hashlib
+from typing import Any, Optional
+import orjson
+from fastapi import Request, Response
+
+
+class StaticJSON:
+    """Pre-rendered JSON body served with an ETag and Cache-Control header."""
+
+    def __init__(self, content: Any, max_age: int):
+        self.body = orjson.dumps(content)
+        digest = hashlib.sha1(self.body, usedforsecurity=False).hexdigest()
+        self.etag = f'"{digest[:16]}"'
+        self.headers = {
+            "ETag": self.etag,
+            "Cache-Control": f"public, max-age={max_age}",
+        }
+
+    def response(self, request: Request) -> Response:
+        """Return the body, or 304 Not Modified if the client's copy is current."""
+        if _etag_matches(request.headers.get("if-none-match"), self.etag):
+            return Response(status_code=304, headers=self.headers)
+        return Response(
+            content=self.body, media_type="application/json", headers=self.headers
+        )
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison per RFC 9110: ignore W/ prefixes, and "*" matches any."""
+    if not if_none_match:
+        return False
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag.removeprefix("W/") == etag:
+            return True
+    return False
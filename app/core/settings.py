@@ -1,5 +1,6 @@
+from functools import lru_cache
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from pydantic import Field
+from pydantic import Field, model_validator
 from typing import Optional, List
 
 
@@ -14,7 +15,10 @@ class Settings(BaseSettings):
     """
 
     model_config = SettingsConfigDict(
-        env_file=".env", env_file_encoding="utf-8", case_sensitive=False, extra="ignore"
+        env_file=".env",
+        env_file_encoding="utf-8",
+        case_sensitive=False,
+        extra="ignore",
     )
 
     # Application Configuration
@@ -44,6 +48,25 @@ class Settings(BaseSettings):
     )
     algorithm: str = Field(default="HS256", description="JWT algorithm")
 
+    # CORS Configuration
+    cors_allow_methods: List[str] = Field(
+        default=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
+        description="HTTP methods allowed for cross-origin requests",
+    )
+    cors_allow_headers: List[str] = Field(
+        default=[
+            "Authorization",
+            "Content-Type",
+            "X-Request-ID",
+            "traceparent",
+            "tracestate",
+        ],
+        description="Request headers allowed for cross-origin requests",
+    )
+    cors_max_age: int = Field(
+        default=86400, description="Seconds browsers may cache CORS preflight results"
+    )
+
     # Database Configuration
     database_url: str = Field(
         default="sqlite:///./app.db", description="Database connection URL"
@@ -55,6 +78,7 @@ class Settings(BaseSettings):
     redis_password: Optional[str] = Field(default=None, description="Redis password")
 
     # OpenTelemetry Configuration
+    otel_enabled: bool = Field(default=True, description="Enable OpenTelemetry tracing")
     otel_exporter_otlp_endpoint: str = Field(
         default="http://localhost:14317", description="OpenTelemetry OTLP endpoint"
     )
@@ -64,9 +88,22 @@ class Settings(BaseSettings):
     otel_service_version: str = Field(
         default="0.1.0", description="OpenTelemetry service version"
     )
+    otel_bsp_max_queue_size: int = Field(
+        default=2048, description="Maximum spans buffered before dropping"
+    )
+    otel_bsp_max_export_batch_size: int = Field(
+        default=512, description="Maximum spans sent per export call"
+    )
+    otel_bsp_schedule_delay_millis: int = Field(
+        default=5000, description="Delay between span exports in milliseconds"
+    )
 
     # Logging Configuration
     log_level: str = Field(default="INFO", description="Logging level")
+    log_excluded_paths: List[str] = Field(
+        default=["/health", "/metrics", "/livez", "/readyz"],
+        description="Request paths skipped by the logging middleware",
+    )
 
     # External Services (Optional)
     external_api_url: Optional[str] = Field(
@@ -93,20 +130,20 @@ class Settings(BaseSettings):
             return ["https://yourdomain.com", "https://www.yourdomain.com"]
         return ["*"]  # Allow all in development
 
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        # Validate critical settings in production
-        if self.environment == "production":
-            self._validate_production_settings()
-
-    def _validate_production_settings(self):
+    @model_validator(mode="after")
+    def _validate_production_settings(self) -> "Settings":
         """Validate critical settings for production environment."""
+        if self.environment.lower() != "production":
+            return self
+
         if self.secret_key == "your-secret-key-change-in-production":
             raise ValueError("SECRET_KEY must be set in production environment")
 
         if self.debug:
             raise ValueError("DEBUG must be False in production environment")
 
+        return self
+
     @property
     def is_development(self) -> bool:
         """Check if running in development environment."""
@@ -123,13 +160,16 @@ class Settings(BaseSettings):
         return self.environment.lower() == "testing"
 
 
-# Create global settings instance
-settings = Settings()
-
-
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """
     Dependency function to get settings instance.
     Useful for FastAPI dependency injection.
+
+    The instance is built once and shared with the module-level ``settings``.
     """
-    return settings
+    return Settings()
+
+
+# Create global settings instance
+settings = get_settings()
@@ -8,9 +8,15 @@ from opentelemetry.trace.propagation.tracecontext import TraceContextTextMapProp
 from opentelemetry.instrumentation.httpx import HTTPXClientInstrumentor
 from app.core.settings import settings
 
+_initialized = False
+
 
 def setup_tracer():
     """Setup OpenTelemetry tracer with configuration from settings."""
+    global _initialized
+    if _initialized:
+        return
+
     resource = Resource.create(
         {
             "service.name": settings.otel_service_name,
@@ -25,7 +31,13 @@ def setup_tracer():
     otlp_exporter = OTLPSpanExporter(
         endpoint=settings.otel_exporter_otlp_endpoint, insecure=True
     )
-    span_processor = BatchSpanProcessor(otlp_exporter)
+    # Larger batches mean fewer export calls under load
+    span_processor = BatchSpanProcessor(
+        otlp_exporter,
+        max_queue_size=settings.otel_bsp_max_queue_size,
+        max_export_batch_size=settings.otel_bsp_max_export_batch_size,
+        schedule_delay_millis=settings.otel_bsp_schedule_delay_millis,
+    )
     trace_provider.add_span_processor(span_processor)
 
     trace.set_tracer_provider(trace_provider)
@@ -33,3 +45,5 @@ def setup_tracer():
 
     # Instrument HTTP client
     HTTPXClientInstrumentor().instrument()
+
+    _initialized = True
@@ -1,77 +1,96 @@
-from fastapi import FastAPI, Depends
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from app.core.settings import settings, get_settings, Settings
-from app.core.middleware import LoggingMiddleware, RequestIDMiddleware
-from app.core.tracer import setup_tracer
-from app.core.instrumentation import instrument_fastapi_app
-from app.core.telemetry.tracing import tracer
+from app.core.settings import settings
+from app.core.middleware import ObservabilityMiddleware
+from app.core.responses import StaticJSON
 
-# Initialize tracing before creating FastAPI app
-setup_tracer()
+# Settings are static for the process lifetime, so resolve them once
+_IS_PRODUCTION = settings.is_production
+_PREFIX = settings.api_v1_prefix
+_ORIGINS = tuple(settings.allowed_origins)
+
+# Static bodies are rendered once and served with ETag/Cache-Control headers
+_ROOT_RESPONSE = StaticJSON(
+    {
+        "message": "Hello World",
+        "app_name": settings.app_name,
+        "version": settings.app_version,
+        "environment": settings.environment,
+    },
+    max_age=30,
+)
+_HEALTH_RESPONSE = StaticJSON(
+    {
+        "status": "healthy",
+        "app_name": settings.app_name,
+        "version": settings.app_version,
+        "environment": settings.environment,
+    },
+    max_age=5,
+)
+_SETTINGS_RESPONSE = StaticJSON(
+    {
+        "app_name": settings.app_name,
+        "app_version": settings.app_version,
+        "environment": settings.environment,
+        "debug": settings.debug,
+        "api_v1_prefix": settings.api_v1_prefix,
+        "log_level": settings.log_level,
+        "otel_service_name": settings.otel_service_name,
+    },
+    max_age=30,
+)
+
+# Initialize tracing before creating FastAPI app. The OTel SDK and exporter are
+# only imported when enabled; otherwise the API's default no-op tracer is used.
+if settings.otel_enabled:
+    from app.core.tracer import setup_tracer
+
+    setup_tracer()
 
 # Create FastAPI app with settings
 app = FastAPI(
     title=settings.app_name,
     version=settings.app_version,
     debug=settings.debug,
-    openapi_url=f"{settings.api_v1_prefix}/openapi.json"
-    if not settings.is_production
-    else None,
-    docs_url=f"{settings.api_v1_prefix}/docs" if not settings.is_production else None,
-    redoc_url=f"{settings.api_v1_prefix}/redoc" if not settings.is_production else None,
+    openapi_url=None if _IS_PRODUCTION else f"{_PREFIX}/openapi.json",
+    docs_url=None if _IS_PRODUCTION else f"{_PREFIX}/docs",
+    redoc_url=None if _IS_PRODUCTION else f"{_PREFIX}/redoc",
 )
 
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=settings.allowed_origins,
+    allow_origins=_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=tuple(settings.cors_allow_methods),
+    allow_headers=tuple(settings.cors_allow_headers),
+    max_age=settings.cors_max_age,
 )
 
 # Instrument the FastAPI app for automatic HTTP tracing
-instrument_fastapi_app(app)
+if settings.otel_enabled:
+    from app.core.instrumentation import instrument_fastapi_app
+
+    instrument_fastapi_app(app)
 
-# Add custom middleware
-app.add_middleware(LoggingMiddleware)
-app.add_middleware(RequestIDMiddleware)
+# Add request ID, timing and access logging middleware
+app.add_middleware(ObservabilityMiddleware)
 
 
 @app.get("/")
-def read_root():
+async def read_root(request: Request):
     """Root endpoint that returns a welcome message."""
-    with tracer.start_as_current_span("root"):
-        return {
-            "message": "Hello World",
-            "app_name": settings.app_name,
-            "version": settings.app_version,
-            "environment": settings.environment,
-        }
+    return _ROOT_RESPONSE.response(request)
 
 
 @app.get("/health")
-def health_check():
+async def health_check(request: Request):
     """Health check endpoint."""
-    with tracer.start_as_current_span("health_check"):
-        return {
-            "status": "healthy",
-            "app_name": settings.app_name,
-            "version": settings.app_version,
-            "environment": settings.environment,
-        }
+    return _HEALTH_RESPONSE.response(request)
 
 
 @app.get("/settings")
-def get_app_settings(current_settings: Settings = Depends(get_settings)):
+async def get_app_settings(request: Request):
     """Get current application settings (non-sensitive data only)."""
-    with tracer.start_as_current_span("get_settings"):
-        return {
-            "app_name": current_settings.app_name,
-            "app_version": current_settings.app_version,
-            "environment": current_settings.environment,
-            "debug": current_settings.debug,
-            "api_v1_prefix": current_settings.api_v1_prefix,
-            "log_level": current_settings.log_level,
-            "otel_service_name": current_settings.otel_service_name,
-        }
+    return _SETTINGS_RESPONSE.response(request)
@@ -0,0 +1,23 @@
+import pytest
+from fastapi.testclient import TestClient
+from app.core.settings import Settings
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Shared test client; app startup/shutdown runs once per session."""
+    # Imported here so collection alone never builds the app or starts tracing
+    from app.main import app
+
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="session")
+def default_settings():
+    """Settings holding only declared defaults, shared across read-only tests.
+
+    model_construct skips env/.env sources and validation; tests that exercise
+    either must build Settings(...) themselves.
+    """
+    return Settings.model_construct()
@@ -1,10 +1,9 @@
-from fastapi.testclient import TestClient
-from app.main import app
+import os
+import subprocess
+import sys
 
-client = TestClient(app)
 
-
-def test_main():
+def test_main(client):
     response = client.get("/")
     assert response.status_code == 200
     data = response.json()
@@ -14,7 +13,7 @@ def test_main():
     assert "environment" in data
 
 
-def test_health_check():
+def test_health_check(client):
     response = client.get("/health")
     assert response.status_code == 200
     data = response.json()
@@ -24,10 +23,80 @@ def test_health_check():
     assert "environment" in data
 
 
-def test_settings_endpoint():
+def test_settings_endpoint(client):
     response = client.get("/settings")
     assert response.status_code == 200
     data = response.json()
     assert "app_name" in data
     assert "environment" in data
     assert "debug" in data
+
+
+def test_request_is_logged(client, caplog):
+    with caplog.at_level("INFO", logger="app"):
+        client.get("/")
+    assert "Finished processing request" in caplog.messages
+
+
+def test_excluded_path_is_not_logged(client, caplog):
+    with caplog.at_level("INFO", logger="app"):
+        response = client.get("/health")
+        docs_response = client.get("/api/v1/openapi.json")
+    assert response.status_code == 200
+    assert docs_response.status_code == 200
+    assert "Finished processing request" not in caplog.messages
+
+
+def test_request_id_header(client):
+    response = client.get("/", headers={"X-Request-ID": "test-request-id"})
+    assert response.headers["X-Request-ID"] == "test-request-id"
+
+    response = client.get("/health")
+    assert response.headers["X-Request-ID"]
+
+
+def test_static_endpoints_support_conditional_get(client):
+    response = client.get("/health")
+    assert response.status_code == 200
+    assert response.headers["Cache-Control"] == "public, max-age=5"
+    etag = response.headers["ETag"]
+
+    response = client.get("/health", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["ETag"] == etag
+
+    for if_none_match in (f'"other", W/{etag}', "*"):
+        response = client.get("/health", headers={"If-None-Match": if_none_match})
+        assert response.status_code == 304
+
+    response = client.get("/health", headers={"If-None-Match": '"other"'})
+    assert response.status_code == 200
+
+
+def test_cors_preflight_is_cacheable(client):
+    response = client.options(
+        "/settings",
+        headers={
+            "Origin": "http://localhost:3000",
+            "Access-Control-Request-Method": "GET",
+            "Access-Control-Request-Headers": "X-Request-ID, traceparent, tracestate",
+        },
+    )
+    assert response.status_code == 200
+    assert response.headers["Access-Control-Max-Age"] == "86400"
+
+
+def test_otel_disabled_skips_sdk_imports():
+    code = (
+        "import sys, app.main; "
+        "print(any(m in sys.modules for m in ('opentelemetry.sdk', 'grpc')))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        env={**os.environ, "OTEL_ENABLED": "false"},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == "False"
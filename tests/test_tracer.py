@@ -0,0 +1,40 @@
+from unittest.mock import MagicMock
+from app.core import tracer
+from app.core.settings import Settings
+
+
+def test_setup_tracer_runs_once_with_batch_settings(monkeypatch):
+    """Test that setup_tracer is idempotent and passes the BSP tunables through."""
+    exporter = MagicMock(name="OTLPSpanExporter")
+    processor = MagicMock(name="BatchSpanProcessor")
+    set_tracer_provider = MagicMock(name="set_tracer_provider")
+    instrumentor = MagicMock(name="HTTPXClientInstrumentor")
+
+    monkeypatch.setattr(tracer, "_initialized", False)
+    monkeypatch.setattr(tracer, "OTLPSpanExporter", exporter)
+    monkeypatch.setattr(tracer, "BatchSpanProcessor", processor)
+    monkeypatch.setattr(tracer.trace, "set_tracer_provider", set_tracer_provider)
+    monkeypatch.setattr(tracer, "HTTPXClientInstrumentor", instrumentor)
+    monkeypatch.setattr(
+        tracer,
+        "settings",
+        Settings(
+            otel_bsp_max_queue_size=100,
+            otel_bsp_max_export_batch_size=10,
+            otel_bsp_schedule_delay_millis=250,
+            _env_file=None,
+        ),
+    )
+
+    tracer.setup_tracer()
+    tracer.setup_tracer()
+
+    exporter.assert_called_once()
+    processor.assert_called_once_with(
+        exporter.return_value,
+        max_queue_size=100,
+        max_export_batch_size=10,
+        schedule_delay_millis=250,
+    )
+    set_tracer_provider.assert_called_once()
+    instrumentor.return_value.instrument.assert_called_once_with()